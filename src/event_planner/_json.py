@@ -0,0 +1,49 @@
+"""
+Encodage JSON du fichier de stockage.
+
+orjson est une dépendance optionnelle : son analyseur et son encodeur natifs
+sont utilisés s'il est installé, le module json standard sinon. Dans les deux
+cas on manipule directement des octets UTF-8, sans passer par des str.
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    orjson = None
+
+# orjson.JSONDecodeError hérite de json.JSONDecodeError : une seule exception à
+# intercepter quel que soit le moteur, y compris pour de l'UTF-8 invalide (voir
+# _stdlib_loads)
+JSONDecodeError = json.JSONDecodeError
+
+# orjson encode les datetime nativement, au format ISO 8601 de isoformat()
+NATIVE_DATETIME = orjson is not None
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    """Encode un objet en JSON UTF-8"""
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+def _stdlib_loads(data: bytes) -> Any:
+    """
+    Décode du JSON UTF-8, comme orjson.loads
+    
+    json.loads lève UnicodeDecodeError, et non JSONDecodeError, sur une
+    ligne tronquée au milieu d'un caractère multi-octets.
+    
+    Raises:
+        JSONDecodeError: Si le JSON ou l'UTF-8 est invalide
+    """
+    try:
+        text = data.decode('utf-8')
+    except UnicodeDecodeError as exc:
+        raise JSONDecodeError("UTF-8 invalide", data.decode('utf-8', 'replace'), exc.start) from exc
+    return json.loads(text)
+
+if orjson is not None:
+    dumps = orjson.dumps
+    loads = orjson.loads
+else:  # pragma: no cover - dépendance optionnelle
+    dumps = _stdlib_dumps
+    loads = _stdlib_loads
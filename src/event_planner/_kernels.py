@@ -0,0 +1,188 @@
+"""
+Noyaux de calcul pour la détection de conflits entre intervalles.
+
+Les noyaux travaillent sur des bornes entières (microsecondes, voir
+Event._start_ts / Event._end_ts), triées par début comme les colonnes
+d'EventManager, et renvoient des paires d'indices.
+NumPy et Numba sont des dépendances optionnelles : sans NumPy, un balayage en
+pur Python est utilisé, et Numba n'est chargé que pour les très gros volumes.
+Tous deux ne sont importés qu'au premier calcul qui en a besoin, pour ne pas
+alourdir le démarrage de la CLI.
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from itertools import accumulate, repeat
+from typing import List, Sequence, Tuple
+
+# En dessous de ce nombre d'intervalles, le coût de conversion vers NumPy
+# dépasse le gain de la vectorisation
+NUMPY_MIN_SIZE = 64
+# Numba n'est rentable qu'au-delà de ce seuil : son import et le chargement du
+# noyau depuis le cache disque coûtent plusieurs centaines de millisecondes
+NUMBA_MIN_SIZE = 50_000
+
+Pairs = Tuple[List[int], List[int]]
+
+
+def conflict_pairs(starts: Sequence[int], ends: Sequence[int]) -> Pairs:
+    """
+    Trouve toutes les paires d'intervalles semi-ouverts qui se chevauchent.
+
+    Une fois les intervalles triés par début, les partenaires de l'intervalle i
+    parmi les suivants sont exactement ceux qui commencent avant sa fin,
+    c'est-à-dire la plage [i + 1, bisect_left(débuts, fin_i)[. Aucun tri n'est
+    nécessaire et la complexité est O(n log n + k), k étant le nombre de paires.
+
+    Args:
+        starts: Bornes de début des intervalles, triées par ordre croissant
+        ends: Bornes de fin des intervalles (même longueur que starts)
+
+    Returns:
+        Pairs: Deux listes d'indices de même longueur, chaque paire
+        (firsts[p], seconds[p]) étant un conflit rapporté une seule fois
+    """
+    if len(starts) >= NUMPY_MIN_SIZE and _numpy() is not None:
+        return _conflict_pairs_numpy(starts, ends)
+    return _conflict_pairs_python(starts, ends)
+
+
+def cross_pairs(starts: Sequence[int], ends: Sequence[int],
+                other_starts: Sequence[int], other_ends: Sequence[int]) -> Pairs:
+    """
+    Trouve les paires qui se chevauchent entre deux ensembles d'intervalles.
+
+    Chaque paire est trouvée depuis celui de ses deux intervalles qui commence
+    le premier (le premier ensemble en cas d'égalité) : les partenaires de
+    l'intervalle i dans l'autre ensemble sont ceux qui commencent dans
+    [début_i, fin_i[, une plage contiguë bornée par dichotomie. Complexité
+    O((n + m) log(n + m) + k).
+
+    Args:
+        starts: Bornes de début du premier ensemble, triées
+        ends: Bornes de fin du premier ensemble
+        other_starts: Bornes de début du second ensemble, triées
+        other_ends: Bornes de fin du second ensemble
+
+    Returns:
+        Pairs: Indices dans le premier ensemble et indices correspondants
+        dans le second
+    """
+    firsts: List[int] = []
+    seconds: List[int] = []
+    for index in range(len(starts)):
+        lo = bisect_left(other_starts, starts[index])
+        hi = bisect_left(other_starts, ends[index], lo)
+        firsts.extend(repeat(index, hi - lo))
+        seconds.extend(range(lo, hi))
+    for other_index in range(len(other_starts)):
+        lo = bisect_right(starts, other_starts[other_index])
+        hi = bisect_left(starts, other_ends[other_index], lo)
+        firsts.extend(range(lo, hi))
+        seconds.extend(repeat(other_index, hi - lo))
+    return firsts, seconds
+
+
+def running_max(ends: Sequence[int]) -> array:
+    """
+    Calcule le maximum cumulé des bornes de fin.
+
+    Sur des intervalles triés par début, l'élément i est la plus tardive des
+    fins des intervalles [0, i] : la colonne est croissante et se prête donc
+    à une recherche dichotomique.
+
+    Args:
+        ends: Bornes de fin
+
+    Returns:
+        array: Maximums cumulés, en int64
+    """
+    if len(ends) >= NUMPY_MIN_SIZE and (np := _numpy()) is not None:
+        maxima = array('q')
+        maxima.frombytes(np.maximum.accumulate(np.asarray(ends, dtype=np.int64)).tobytes())
+        return maxima
+    return array('q', accumulate(ends, max))
+
+
+def _conflict_pairs_python(starts: Sequence[int], ends: Sequence[int]) -> Pairs:
+    """
+    Version pur Python : une recherche dichotomique par intervalle, les paires
+    étant ajoutées par plages entières.
+    """
+    firsts: List[int] = []
+    seconds: List[int] = []
+    for index in range(len(starts)):
+        # Un intervalle qui commence à la fin de celui-ci ne le chevauche pas
+        stop = bisect_left(starts, ends[index], index + 1)
+        firsts.extend(repeat(index, stop - index - 1))
+        seconds.extend(range(index + 1, stop))
+    return firsts, seconds
+
+
+@lru_cache(maxsize=None)
+def _numpy():
+    """
+    Importe NumPy à la première utilisation.
+
+    Returns:
+        Le module numpy, ou None s'il n'est pas installé
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+@lru_cache(maxsize=None)
+def _numba_kernel():
+    """
+    Charge le noyau Numba à la première utilisation.
+
+    Returns:
+        Le noyau compilé, ou None si Numba n'est pas installé
+    """
+    try:
+        from event_planner._kernels_numba import sorted_conflict_pairs
+    except ImportError:
+        return None
+    return sorted_conflict_pairs
+
+
+def _conflict_pairs_numpy(starts: Sequence[int], ends: Sequence[int]) -> Pairs:
+    """
+    Version vectorisée, sans boucle Python ni matrice n x n. Au-delà de
+    NUMBA_MIN_SIZE, l'énumération des paires est confiée au noyau Numba s'il
+    est disponible.
+    """
+    np = _numpy()
+    # Vues sans copie sur les colonnes array('q') d'EventManager
+    starts = np.asarray(starts, dtype=np.int64)
+    ends = np.asarray(ends, dtype=np.int64)
+
+    kernel = _numba_kernel() if len(starts) >= NUMBA_MIN_SIZE else None
+    if kernel is not None:
+        firsts, seconds = kernel(starts, ends)
+    else:
+        firsts, seconds = _expand_sorted_pairs(starts, ends)
+    return firsts.tolist(), seconds.tolist()
+
+
+def _expand_sorted_pairs(sorted_starts, sorted_ends):
+    """
+    Énumère les paires en conflit d'intervalles triés par début, avec NumPy.
+
+    Returns:
+        Deux tableaux d'indices de même longueur
+    """
+    np = _numpy()
+    size = len(sorted_starts)
+    stops = np.searchsorted(sorted_starts, sorted_ends, side='left')
+    # stops[i] >= i + 1 puisque tout début trié avant i précède la fin de i
+    counts = stops - np.arange(1, size + 1)
+
+    firsts = np.repeat(np.arange(size), counts)
+    # Position de chaque paire dans le bloc de son intervalle i
+    block_offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    seconds = firsts + 1 + (np.arange(len(firsts)) - block_offsets)
+    return firsts, seconds
@@ -0,0 +1,47 @@
+"""
+Noyau de détection de conflits compilé par Numba.
+
+Ce module n'est importé qu'à la demande par event_planner._kernels : Numba
+est une dépendance optionnelle et son import est coûteux pour la CLI.
+"""
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True, parallel=True)
+def sorted_conflict_pairs(sorted_starts, sorted_ends):
+    """
+    Énumère les paires en conflit d'intervalles triés par début.
+
+    Les partenaires de l'intervalle i parmi les suivants sont ceux de la plage
+    [i + 1, searchsorted(débuts, fin_i)[. Une première passe parallèle compte
+    les paires de chaque intervalle, une seconde les écrit directement dans des
+    tampons préalloués, sans matrice n x n ni tableau intermédiaire.
+
+    Args:
+        sorted_starts: Débuts triés (int64)
+        sorted_ends: Fins correspondantes (int64)
+
+    Returns:
+        Deux tableaux int64 d'indices de même longueur
+    """
+    size = sorted_starts.shape[0]
+    counts = np.empty(size, dtype=np.int64)
+    for i in prange(size):
+        # Recherche limitée aux intervalles suivants, comme bisect_left(..., i + 1)
+        counts[i] = np.searchsorted(sorted_starts[i + 1:], sorted_ends[i])
+
+    offsets = np.empty(size, dtype=np.int64)
+    total = 0
+    for i in range(size):
+        offsets[i] = total
+        total += counts[i]
+
+    firsts = np.empty(total, dtype=np.int64)
+    seconds = np.empty(total, dtype=np.int64)
+    for i in prange(size):
+        offset = offsets[i]
+        for k in range(counts[i]):
+            firsts[offset + k] = i
+            seconds[offset + k] = i + 1 + k
+    return firsts, seconds
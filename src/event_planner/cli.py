@@ -1,15 +1,37 @@
 import click
 from datetime import datetime
-from pathlib import Path
 from typing import Optional
 from event_planner.event import Event
-from event_planner.event_manager import EventManager
+from event_planner.event_manager import DEFAULT_STORAGE_PATH, EventManager
 
 def get_event_manager():
     """Helper to create EventManager instance with default storage"""
-    storage_path = Path.home() / '.event_planner' / 'events.json'
+    storage_path = DEFAULT_STORAGE_PATH
+    # Reprend le fichier de l'ancien format, converti au premier chargement
+    legacy_path = storage_path.with_suffix('.json')
+    if not storage_path.exists() and legacy_path.exists():
+        legacy_path.rename(storage_path)
     return EventManager(storage_path=storage_path)
 
+class IsoDateTime(click.ParamType):
+    """
+    Type Click pour les dates, analysées par datetime.fromisoformat.
+    
+    Contrairement à click.DateTime, qui essaie ses formats avec
+    datetime.strptime en pur Python, fromisoformat est implémenté en C.
+    """
+    name = 'datetime'
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, datetime):
+            return value
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            self.fail(f"date invalide {value!r} (format: YYYY-MM-DD HH:MM)", param, ctx)
+
+ISO_DATETIME = IsoDateTime()
+
 @click.group()
 def cli():
     """Gestionnaire d'événements en ligne de commande"""
@@ -22,7 +44,10 @@ def cli():
 @click.option('--end_time', '-e', required=True,
               help='Date et heure de fin (format: YYYY-MM-DD HH:MM)')
 @click.option('--description', '-d', help='Description de l\'événement')
-def add(name: str, start_time: str, end_time: str, description: str = None):
+@click.option('--no-conflict-check', is_flag=True,
+              help='Ajoute sans vérifier les conflits, ni relire les événements existants')
+def add(name: str, start_time: str, end_time: str, description: str = None,
+        no_conflict_check: bool = False):
     """Ajoute un nouvel événement"""
     try:
         # Parse les dates
@@ -39,7 +64,7 @@ def add(name: str, start_time: str, end_time: str, description: str = None):
         
         # Ajoute l'événement
         manager = get_event_manager()
-        if manager.add_event(event):
+        if manager.add_event(event, check_conflicts=not no_conflict_check):
             click.echo(f"Événement '{name}' ajouté avec succès (ID: {event.id})")
         else:
             click.echo("Erreur lors de l'ajout de l'événement", err=True)
@@ -61,9 +86,9 @@ def remove(event_id: str):
 
 @cli.command()
 @click.option('--conflicts', '-c', is_flag=True, help='Affiche uniquement les événements en conflit')
-@click.option('--start', '-s', type=click.DateTime(formats=["%Y-%m-%d %H:%M"]), 
+@click.option('--start', '-s', type=ISO_DATETIME, 
               help='Date de début (format: YYYY-MM-DD HH:MM)')
-@click.option('--end', '-e', type=click.DateTime(formats=["%Y-%m-%d %H:%M"]), 
+@click.option('--end', '-e', type=ISO_DATETIME, 
               help='Date de fin (format: YYYY-MM-DD HH:MM)')
 def list(conflicts: bool, start: Optional[datetime] = None, end: Optional[datetime] = None):
     """Liste tous les événements ou affiche les conflits.
@@ -72,6 +97,19 @@ def list(conflicts: bool, start: Optional[datetime] = None, end: Optional[dateti
     """
     manager = get_event_manager()
     
+    # Chargement hors du try : seule la comparaison aux bornes est traduite
+    events = manager.list_events()
+    if start or end:
+        try:
+            events = manager.list_events_between(start, end)
+        except TypeError:
+            # Dates avec fuseau face à des événements naïfs, ou l'inverse
+            raise click.BadParameter(
+                "les dates doivent être, comme les événements enregistrés, "
+                "toutes avec fuseau horaire ou toutes sans",
+                param_hint="'--start' / '--end'"
+            )
+    
     if conflicts:
         conflict_dict = manager.find_conflicts()
         if not conflict_dict:
@@ -81,15 +119,16 @@ def list(conflicts: bool, start: Optional[datetime] = None, end: Optional[dateti
         # Filtrer les conflits par date si nécessaire
         if start or end:
             filtered_conflicts = {}
-            events_in_range = manager.list_events_between(start, end)
+            # Ensemble des IDs : test d'appartenance en O(1), sans comparer
+            # les événements champ par champ
+            ids_in_range = {e.id for e in events}
             
             for event_id, conflicting_events in conflict_dict.items():
-                event = manager.get_event_by_id(event_id)
-                if event and event in events_in_range:
+                if event_id in ids_in_range:
                     # Ne garder que les événements en conflit qui sont aussi dans la période
                     filtered_conflicts[event_id] = [
                         e for e in conflicting_events 
-                        if e in events_in_range
+                        if e.id in ids_in_range
                     ]
                     if filtered_conflicts[event_id]:  # Supprimer si plus de conflits dans la période
                         continue
@@ -101,16 +140,19 @@ def list(conflicts: bool, start: Optional[datetime] = None, end: Optional[dateti
             click.echo("Aucun conflit trouvé dans la période spécifiée")
             return
             
-        click.echo("Conflits détectés:")
+        # Toute la sortie est assemblée puis écrite en un seul appel à click.echo
+        lines = ["Conflits détectés:"]
         for event_id, conflicting_events in conflict_dict.items():
             event = manager.get_event_by_id(event_id)
             if event:
-                click.echo(f"\nÉvénement: {event.name} (ID: {event.id})")
-                click.echo("En conflit avec:")
-                for conf_event in conflicting_events:
-                    click.echo(f"  - {conf_event.name} (ID: {conf_event.id})")
+                lines.append(f"\nÉvénement: {event.name} (ID: {event.id})")
+                lines.append("En conflit avec:")
+                lines.extend(
+                    f"  - {conf_event.name} (ID: {conf_event.id})"
+                    for conf_event in conflicting_events
+                )
+        click.echo('\n'.join(lines))
     else:
-        events = manager.list_events_between(start, end)
         if not events:
             if start or end:
                 click.echo("Aucun événement trouvé dans la période spécifiée")
@@ -119,22 +161,23 @@ def list(conflicts: bool, start: Optional[datetime] = None, end: Optional[dateti
             return
             
         # Afficher la période si spécifiée
-        if start or end:
-            click.echo("Liste des événements", nl=False)
-            if start:
-                click.echo(f" depuis le {start.strftime('%Y-%m-%d %H:%M')}", nl=False)
-            if end:
-                click.echo(f" jusqu'au {end.strftime('%Y-%m-%d %H:%M')}", nl=False)
-            click.echo(":")
-        else:
-            click.echo("Liste des événements:")
-            
+        period = ""
+        if start:
+            period += f" depuis le {start.strftime('%Y-%m-%d %H:%M')}"
+        if end:
+            period += f" jusqu'au {end.strftime('%Y-%m-%d %H:%M')}"
+        
+        # Toute la sortie est assemblée puis écrite en un seul appel à click.echo
+        lines = [f"Liste des événements{period}:"]
         for event in events:
-            click.echo(f"\nID: {event.id}")
-            click.echo(f"Nom: {event.name}")
-            click.echo(f"Début: {event.start_time}")
-            click.echo(f"Fin: {event.end_time}")
+            lines.append(
+                f"\nID: {event.id}\n"
+                f"Nom: {event.name}\n"
+                f"Début: {event.start_time}\n"
+                f"Fin: {event.end_time}"
+            )
             if event.description:
-                click.echo(f"Description: {event.description}")
+                lines.append(f"Description: {event.description}")
+        click.echo('\n'.join(lines))
 if __name__ == '__main__':
     cli()
\ No newline at end of file
@@ -1,15 +1,38 @@
-from datetime import datetime, timedelta
-from typing import Optional
-from uuid import uuid4, UUID
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Optional
+from uuid import UUID, uuid4
 from dataclasses import dataclass, field
+from event_planner import _json
 
-@dataclass
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+def _to_timestamp(moment: datetime) -> int:
+    """
+    Convertit une date en nombre entier de microsecondes depuis l'epoch.
+    
+    Une date naïve est comptée depuis l'epoch naïve plutôt que convertie via
+    le fuseau local, ce qui garde l'ordre des dates intact autour des
+    changements d'heure.
+    
+    Args:
+        moment (datetime): Date à convertir
+    
+    Returns:
+        int: Microsecondes écoulées depuis le 1er janvier 1970
+    """
+    epoch = _EPOCH if moment.utcoffset() is None else _EPOCH_UTC
+    return (moment - epoch) // _MICROSECOND
+
+@dataclass(slots=True)
 class Event:
     """
     Représente un événement avec ses propriétés essentielles.
 
     Attributs:
-    - id: Identifiant unique de l'événement
+    - id: Identifiant unique de l'événement (UUID sous forme de texte)
     - name: Nom de l'événement
     - start_time: Date et heure de début
     - end_time: Date et heure de fin
@@ -19,8 +42,17 @@ class Event:
     name: str
     start_time: datetime
     end_time: datetime
-    id: UUID = field(default_factory=uuid4)
+    id: str = field(default_factory=lambda: str(uuid4()))
     description: Optional[str] = None
+    # Bornes en microsecondes, pour des comparaisons entières dans les boucles
+    # chaudes, recalculées à chaque affectation d'une date (voir _set_start_time)
+    _start_ts: int = field(init=False, repr=False, compare=False)
+    _end_ts: int = field(init=False, repr=False, compare=False)
+    # Durée, calculée au premier accès
+    _duration: Optional[timedelta] = field(default=None, init=False, repr=False, compare=False)
+    # Dates au format ISO 8601, calculées à la première sérialisation
+    _start_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _end_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """
@@ -31,25 +63,47 @@ class Event:
         
         if self.start_time == self.end_time:
             raise ValueError("La date de début et de fin ne peuvent pas être identiques")
+        
+        # Un UUID passé explicitement est ramené à sa forme texte
+        if not isinstance(self.id, str):
+            self.id = str(self.id)
+    
+    @property
+    def uuid(self) -> UUID:
+        """
+        Identifiant de l'événement sous forme d'objet UUID
+        
+        L'ID est conservé sous forme de texte, l'objet n'est construit qu'à
+        la demande.
+        
+        Returns:
+            UUID: L'identifiant analysé
+            
+        Raises:
+            ValueError: Si l'ID n'est pas un UUID valide
+        """
+        return UUID(self.id)
     
     @property
     def duration(self) -> timedelta:
         """
-        Calcule la durée de l'événement
+        Calcule la durée de l'événement, mise en cache au premier appel
         
         Returns:
             timedelta: Durée de l'événement
         """
-        return self.end_time - self.start_time
+        if self._duration is None:
+            self._duration = self.end_time - self.start_time
+        return self._duration
     
     def overlaps(self, other_event: 'Event') -> bool:
         """
         Vérifie si l'événement actuel chevauche un autre événement.
         
-        Vérifie tous les cas de chevauchement possibles:
-        - Un événement commence pendant l'autre
-        - Un événement se termine pendant l'autre
-        - Un événement englobe complètement l'autre (2 cas possibles)
+        Les intervalles sont semi-ouverts [début, fin[ : deux événements se
+        chevauchent si chacun commence avant la fin de l'autre, ce qui couvre
+        aussi le cas où l'un englobe complètement l'autre. La comparaison se
+        fait sur les bornes entières précalculées.
         
         Args:
             other_event (Event): L'événement à comparer
@@ -60,22 +114,12 @@ class Event:
         Raises:
             ValueError: Si on compare un événement avec lui-même
         """
-        if self.id == other_event.id:
+        # La comparaison d'identité, immédiate, couvre le cas courant avant
+        # celle des IDs
+        if self is other_event or self.id == other_event.id:
             raise ValueError("Impossible de comparer un événement avec lui-même")
             
-        # Vérifie si l'un des événements commence pendant l'autre
-        starts_during = (
-            other_event.start_time <= self.start_time < other_event.end_time or
-            self.start_time <= other_event.start_time < self.end_time
-        )
-        
-        # Vérifie si l'un des événements englobe complètement l'autre
-        is_encompassing = (
-            (self.start_time <= other_event.start_time and self.end_time >= other_event.end_time) or
-            (other_event.start_time <= self.start_time and other_event.end_time >= self.end_time)
-        )
-        
-        return starts_during or is_encompassing
+        return self._start_ts < other_event._end_ts and other_event._start_ts < self._end_ts
     
     def __str__(self) -> str:
         """
@@ -91,17 +135,45 @@ class Event:
         """
         Convertit l'événement en dictionnaire
         
+        Les dates ne sont formatées qu'une fois : le fichier de stockage est
+        réécrit en entier à chaque compaction.
+        
         Returns:
             dict: Représentation en dictionnaire de l'événement
         """
+        if self._start_iso is None:
+            self._start_iso = self.start_time.isoformat()
+            self._end_iso = self.end_time.isoformat()
         return {
-            "id": str(self.id),
+            "id": self.id,
             "name": self.name,
-            "start_time": self.start_time.isoformat(),
-            "end_time": self.end_time.isoformat(),
+            "start_time": self._start_iso,
+            "end_time": self._end_iso,
             "description": self.description
         }
     
+    def to_json(self) -> bytes:
+        """
+        Sérialise l'événement en JSON UTF-8, tel qu'écrit dans le stockage
+        
+        Avec orjson, les dates naïves sont encodées nativement sans passer
+        par isoformat() ; le résultat est identique à celui de to_dict().
+        Les dates avec fuseau passent toujours par to_dict(), orjson
+        tronquant les décalages horaires à la minute.
+        
+        Returns:
+            bytes: L'objet JSON de l'événement
+        """
+        if not _json.NATIVE_DATETIME or self.start_time.tzinfo is not None:
+            return _json.dumps(self.to_dict())
+        return _json.dumps({
+            "id": self.id,
+            "name": self.name,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "description": self.description
+        })
+    
     @classmethod
     def from_dict(cls, data: dict) -> 'Event':
         """
@@ -114,9 +186,127 @@ class Event:
             Event: Instance d'événement
         """
         return cls(
-            id=UUID(data.get('id', str(uuid4()))),
+            id=data.get('id') or str(uuid4()),
             name=data['name'],
             start_time=datetime.fromisoformat(data['start_time']),
             end_time=datetime.fromisoformat(data['end_time']),
             description=data.get('description')
-        )
\ No newline at end of file
+        )
+    
+    @classmethod
+    def _unchecked(cls, name: str, start_time: datetime, end_time: datetime,
+                   id: str, description: Optional[str] = None) -> 'Event':
+        """
+        Crée un événement sans passer par __init__ ni __post_init__
+        
+        Réservé aux données relues depuis le stockage, dont l'ID est déjà une
+        chaîne. L'ordre des dates est vérifié sur les bornes entières déjà
+        calculées, sans comparaison de datetime.
+        
+        Returns:
+            Event: Instance d'événement
+            
+        Raises:
+            ValueError: Si la date de début n'est pas antérieure à la date de fin
+            TypeError: Si l'une des dates est naïve et l'autre avec fuseau, comme
+            pour la comparaison faite par __post_init__
+        """
+        # Calcul de _to_timestamp en ligne, pour ne demander qu'une fois le
+        # décalage de chaque date
+        start_naive = start_time.utcoffset() is None
+        if start_naive != (end_time.utcoffset() is None):
+            raise TypeError("Impossible de comparer des dates naïves et des dates avec fuseau horaire")
+        epoch = _EPOCH if start_naive else _EPOCH_UTC
+        start_ts = (start_time - epoch) // _MICROSECOND
+        end_ts = (end_time - epoch) // _MICROSECOND
+        if start_ts > end_ts:
+            raise ValueError("La date de début doit être antérieure à la date de fin")
+        if start_ts == end_ts:
+            raise ValueError("La date de début et de fin ne peuvent pas être identiques")
+        
+        # Les dates sont écrites dans leurs slots, sans passer par les
+        # propriétés : les bornes sont déjà calculées
+        event = cls.__new__(cls)
+        event.name = name
+        _set_start_slot(event, start_time)
+        _set_end_slot(event, end_time)
+        event.id = id
+        event.description = description
+        event._start_ts = start_ts
+        event._end_ts = end_ts
+        event._duration = None
+        event._start_iso = None
+        event._end_iso = None
+        return event
+    
+    @classmethod
+    def from_dict_list(cls, datas: Iterable[dict]) -> List['Event']:
+        """
+        Crée des événements à partir d'une suite de dictionnaires
+        
+        Les événements sont construits par _unchecked plutôt que par le
+        constructeur : l'ID doit déjà être une chaîne, et l'ordre des dates
+        est vérifié sur les bornes entières. Les fonctions de la boucle sont
+        liées en variables locales, plus rapides d'accès que les attributs et
+        globales pour le chargement de gros fichiers. Les noms sont internés :
+        les titres récurrents d'un calendrier partagent une seule chaîne en
+        mémoire. Un nom qui n'est pas une chaîne (null dans un fichier édité à
+        la main) est repris tel quel, comme par from_dict.
+        
+        Args:
+            datas (Iterable[dict]): Données des événements
+        
+        Returns:
+            List[Event]: Instances d'événements, dans le même ordre
+            
+        Raises:
+            ValueError: Si un événement ne commence pas avant sa fin, comme
+            pour from_dict
+        """
+        fromisoformat = datetime.fromisoformat
+        new_id = uuid4
+        unchecked = cls._unchecked
+        intern = sys.intern
+        return [
+            unchecked(
+                intern(name) if isinstance(name := data['name'], str) else name,
+                fromisoformat(data['start_time']),
+                fromisoformat(data['end_time']),
+                data.get('id') or str(new_id()),
+                data.get('description')
+            )
+            for data in datas
+        ]
+
+# Slots générés par la dataclass pour les dates, masqués ci-dessous par des
+# propriétés ; _unchecked y écrit directement
+_START_TIME_SLOT = Event.__dict__['start_time']
+_END_TIME_SLOT = Event.__dict__['end_time']
+_set_start_slot = _START_TIME_SLOT.__set__
+_set_end_slot = _END_TIME_SLOT.__set__
+
+def _set_start_time(event: Event, value: datetime) -> None:
+    """
+    Affecte la date de début et recalcule les valeurs qui en dérivent
+    
+    Appelée à chaque affectation, y compris dans __init__ ; la durée et les
+    dates ISO seront recalculées au prochain accès. Un événement déjà ajouté
+    à un EventManager ne doit pas voir ses dates modifiées : ses index ne
+    seraient pas mis à jour.
+    """
+    _set_start_slot(event, value)
+    event._start_ts = _to_timestamp(value)
+    event._duration = event._start_iso = event._end_iso = None
+
+def _set_end_time(event: Event, value: datetime) -> None:
+    """
+    Affecte la date de fin et recalcule les valeurs qui en dérivent
+    
+    Voir _set_start_time.
+    """
+    _set_end_slot(event, value)
+    event._end_ts = _to_timestamp(value)
+    event._duration = event._start_iso = event._end_iso = None
+
+setattr(Event, 'start_time', property(_START_TIME_SLOT.__get__, _set_start_time))
+setattr(Event, 'end_time', property(_END_TIME_SLOT.__get__, _set_end_time))
@@ -1,68 +1,484 @@
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Dict, Tuple
 from datetime import datetime
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import chain
+from operator import attrgetter
 import warnings
-import json
+import os
 from pathlib import Path
-from event_planner.event import Event
+from uuid import uuid4
+from event_planner import _json
+from event_planner.event import Event, _to_timestamp
+from event_planner._kernels import conflict_pairs, cross_pairs, running_max
 
-@dataclass
+# Fichier de stockage par défaut, calculé une fois à l'import
+DEFAULT_STORAGE_PATH = Path.home() / '.event_planner' / 'events.jsonl'
+
+# À partir de cette taille de lot, add_events fusionne le lot et reconstruit
+# les index en une passe plutôt que d'insérer les événements un à un
+_BULK_REINDEX_SIZE = 64
+
+# Clé de l'ordre chronologique (début, puis fin), évaluée en C par sort
+_chronological = attrgetter('_start_ts', '_end_ts')
+
+def _check_same_timezone(moment: datetime, reference: Optional[datetime]) -> None:
+    """
+    Vérifie qu'une date est, comme la date de référence, naïve ou avec fuseau.
+    
+    Les comparaisons se font sur des timestamps entiers, qui ne lèvent pas
+    l'erreur de datetime quand on mélange les deux : elle est reproduite ici.
+    
+    Args:
+        moment: La date à vérifier
+        reference: La date de référence, None pour ne rien vérifier
+        
+    Raises:
+        TypeError: Si l'une des dates est naïve et l'autre avec fuseau
+    """
+    if reference is not None and (moment.utcoffset() is None) != (reference.utcoffset() is None):
+        raise TypeError("Impossible de comparer des dates naïves et des dates avec fuseau horaire")
+
+def _join_lines(records: Iterable[bytes]) -> bytes:
+    """
+    Assemble des enregistrements JSON en lignes, dans un seul tampon.
+    
+    Le fichier est ainsi écrit en un appel, sans tampon intermédiaire
+    ni concaténation par ligne.
+    
+    Args:
+        records: Enregistrements encodés, sans fin de ligne
+        
+    Returns:
+        bytes: Les enregistrements, chacun suivi d'un saut de ligne
+    """
+    return b'\n'.join([*records, b''])
+
+def _first_line(f: BinaryIO) -> Tuple[int, bytes]:
+    """
+    Lit la première ligne non vide d'un fichier de stockage.
+    
+    Args:
+        f: Le fichier, ouvert en lecture binaire au début
+        
+    Returns:
+        Tuple[int, bytes]: La position de la ligne dans le fichier et la ligne
+        (vide si le fichier ne contient que des lignes vides)
+    """
+    offset = 0
+    line = f.readline()
+    while line and not line.strip():
+        offset += len(line)
+        line = f.readline()
+    return offset, line
+
+def _parse_records(lines: Iterable[bytes], offset: int = 0) -> Iterator[Tuple[int, dict]]:
+    """
+    Décode les lignes d'un fichier de stockage JSON Lines.
+    
+    Une ligne illisible (écriture interrompue), ou valide mais qui n'est pas
+    un objet JSON, est ignorée.
+    
+    Args:
+        lines: Les lignes du fichier
+        offset: Position de la première ligne dans le fichier
+        
+    Yields:
+        Tuple[int, dict]: La position de chaque ligne et son enregistrement
+    """
+    for line in lines:
+        try:
+            record = _json.loads(line)
+        except _json.JSONDecodeError:
+            record = None
+        if isinstance(record, dict):
+            yield offset, record
+        offset += len(line)
+
+@dataclass(slots=True)
 class EventManager:
     """
     Gestionnaire central pour les opérations sur les événements
+    
+    Les événements sont stockés au format JSON Lines, en ajout seul : chaque
+    ajout écrit une ligne, chaque suppression une ligne "tombstone". Le
+    fichier est réécrit (compacté) lorsque les tombstones deviennent trop
+    nombreuses.
+    
+    Le fichier n'est lu qu'à la première opération qui a besoin des
+    événements existants.
     """
-    storage_path: Path = field(default_factory=lambda: Path.home() / '.event_planner' / 'events.json')
-    _events: List[Event] = field(default_factory=list)
+    storage_path: Path = DEFAULT_STORAGE_PATH
+    # Événements triés chronologiquement, None tant qu'ils ne sont pas chargés
+    _event_list: Optional[List[Event]] = field(default=None, init=False, repr=False)
+    # Nombre de lignes de suppression présentes dans le fichier de stockage
+    _tombstones: int = field(default=0, init=False, repr=False)
+    # Bornes des événements en colonnes int64 contiguës, parallèles à _events
+    # (trié chronologiquement) : bisect et les noyaux de calcul les parcourent
+    # sans toucher aux objets Event
+    _starts: array = field(default_factory=lambda: array('q'), init=False, repr=False)
+    _ends: array = field(default_factory=lambda: array('q'), init=False, repr=False)
+    # Maximum cumulé de _ends (fin la plus tardive parmi les événements qui
+    # commencent au plus tard à chaque position), None tant qu'il n'est pas
+    # recalculé
+    _max_ends: Optional[array] = field(default=None, init=False, repr=False)
+    # Dernier résultat de find_conflicts, None dès que les événements changent
+    _conflicts: Optional[Dict[str, List[Event]]] = field(default=None, init=False, repr=False)
+    # Index des événements par ID
+    _by_id: Dict[str, Event] = field(default_factory=dict, init=False, repr=False)
+    # Position dans le fichier de la ligne de chaque événement, pour les
+    # recherches par ID avant chargement ; None tant qu'il n'est pas construit
+    _offsets: Optional[Dict[str, int]] = field(default=None, init=False, repr=False)
+
+    def _ensure_loaded(self) -> List[Event]:
+        """
+        Charge les événements depuis le stockage s'ils ne l'ont pas encore été.
+        
+        Returns:
+            List[Event]: Les événements, triés chronologiquement
+        """
+        if self._event_list is None:
+            self._event_list = []
+            self._offsets = None
+            self._load_events()
+            self._reindex()
+        return self._event_list
+
+    @property
+    def _events(self) -> List[Event]:
+        """
+        Événements triés chronologiquement, chargés au premier accès.
+        """
+        return self._ensure_loaded()
+
+    def _reindex(self) -> None:
+        """
+        Trie les événements chronologiquement et reconstruit les index.
+        """
+        events = self._event_list
+        assert events is not None, "les événements doivent être chargés avant d'être indexés"
+        events.sort(key=_chronological)
+        self._starts = array('q', (event._start_ts for event in events))
+        self._ends = array('q', (event._end_ts for event in events))
+        self._max_ends = None
+        self._conflicts = None
+        self._by_id = {event.id: event for event in events}
+
+    def _running_max_ends(self) -> array:
+        """
+        Maximum cumulé des fins, recalculé à la demande.
+        
+        Returns:
+            array: Colonne croissante parallèle à _ends
+        """
+        if self._max_ends is None:
+            self._max_ends = running_max(self._ends)
+        return self._max_ends
+
+    def _insert(self, event: Event) -> None:
+        """
+        Insère un événement à sa place dans l'ordre chronologique (début, puis fin).
+        
+        Args:
+            event: L'événement à insérer
+        """
+        lo = bisect_left(self._starts, event._start_ts)
+        hi = bisect_right(self._starts, event._start_ts, lo)
+        # À début égal, on départage par la date de fin
+        index = bisect_right(self._ends, event._end_ts, lo, hi)
+        self._events.insert(index, event)
+        self._starts.insert(index, event._start_ts)
+        self._ends.insert(index, event._end_ts)
+        self._by_id[event.id] = event
+        self._conflicts = None
+        
+        max_ends = self._max_ends
+        if max_ends is not None:
+            end_ts = event._end_ts
+            max_ends.insert(index, max(end_ts, max_ends[index - 1]) if index else end_ts)
+            # La colonne étant croissante, la mise à jour s'arrête au premier
+            # maximum qui atteint déjà cette fin
+            for position in range(index + 1, len(max_ends)):
+                if max_ends[position] >= end_ts:
+                    break
+                max_ends[position] = end_ts
 
-    def __post_init__(self):
+    def _reference_time(self) -> Optional[datetime]:
         """
-        Initialisation après la création de l'instance.
-        Crée le dossier de stockage si nécessaire et charge les événements.
+        Date d'un événement géré, qui fixe le mode (naïf ou avec fuseau) de tous.
+        
+        Returns:
+            Optional[datetime]: Le début du premier événement, None s'il n'y en a aucun
         """
-        self.storage_path.parent.mkdir(parents=True, exist_ok=True)
-        self._load_events()
+        return self._events[0].start_time if self._events else None
+
+    def _stored_reference_time(self) -> Optional[datetime]:
+        """
+        Date d'un événement enregistré, qui fixe le mode de tous, sans charger le fichier.
+        
+        Seule la première ligne d'événement lisible est décodée ; l'événement
+        a pu être supprimé depuis, son mode reste celui du fichier. Un ancien
+        fichier au format tableau JSON est chargé, ce qui le convertit.
+        
+        Returns:
+            Optional[datetime]: Le début du premier événement enregistré, None
+            s'il n'y en a aucun
+        """
+        try:
+            f = open(self.storage_path, 'rb')
+        except FileNotFoundError:
+            return None
+        with f:
+            offset, first_line = _first_line(f)
+            if not first_line.lstrip().startswith(b'['):
+                for _, record in _parse_records(chain((first_line,), f), offset):
+                    if '_tombstone' not in record:
+                        return datetime.fromisoformat(record['start_time'])
+                return None
+        # Ancien format : le chargement le convertit en JSON Lines
+        self._ensure_loaded()
+        return self._reference_time()
+
+    def _index_of(self, event: Event) -> int:
+        """
+        Position d'un événement géré dans la liste triée.
+        
+        Args:
+            event: L'événement recherché (l'instance elle-même)
+            
+        Returns:
+            int: Son index dans _events et les colonnes de bornes
+        """
+        events = self._events
+        index = bisect_left(self._starts, event._start_ts)
+        while events[index] is not event:
+            index += 1
+        return index
 
     def _load_events(self) -> None:
         """
         Charge les événements depuis le fichier de stockage.
-        Initialise une liste vide en cas d'erreur.
+        
+        Les lignes sont lues et rejouées une à une, une tombstone retirant
+        l'événement correspondant, sans charger le fichier entier en mémoire.
+        Une ligne illisible (écriture interrompue) est ignorée. Un ancien
+        fichier au format tableau JSON est converti en JSON Lines, ou déplacé
+        vers un fichier ".corrupt" s'il est illisible.
         """
-        if not self.storage_path.exists():
+        try:
+            f = open(self.storage_path, 'rb')
+        except FileNotFoundError:
             return
 
+        # Les tombstones sont appliquées sur les enregistrements bruts : seuls
+        # les événements encore présents sont construits, en un seul lot
+        records_by_id: Dict[str, dict] = {}
+        legacy_content = None
+        with f:
+            offset, first_line = _first_line(f)
+            if first_line.lstrip().startswith(b'['):
+                legacy_content = first_line + f.read()
+            else:
+                for _, record in _parse_records(chain((first_line,), f), offset):
+                    if '_tombstone' in record:
+                        records_by_id.pop(record['_tombstone'], None)
+                        self._tombstones += 1
+                    else:
+                        # Un enregistrement sans ID (fichier édité à la main) en reçoit un
+                        if not record.get('id'):
+                            record['id'] = str(uuid4())
+                        records_by_id[record['id']] = record
+
+        if legacy_content is None:
+            self._event_list = Event.from_dict_list(records_by_id.values())
+            return
         try:
-            with open(self.storage_path, 'r') as f:
-                events_data = json.load(f)
-                self._events = [Event.from_dict(event_data) for event_data in events_data]
-        except json.JSONDecodeError:
-            self._events = []
+            self._event_list = Event.from_dict_list(
+                data for data in _json.loads(legacy_content) if isinstance(data, dict)
+            )
+        except _json.JSONDecodeError:
+            # Le fichier illisible est mis de côté : les ajouts suivants
+            # écrivent un nouveau fichier au lieu de s'y perdre
+            corrupt_path = self.storage_path.with_name(self.storage_path.name + '.corrupt')
+            os.replace(self.storage_path, corrupt_path)
+            warnings.warn(
+                f"Fichier de stockage illisible, déplacé vers {corrupt_path}",
+                UserWarning
+            )
+            self._event_list = []
+        else:
+            self._compact()
 
-    def _save_events(self) -> None:
+    def _open_for_write(self, path: Path, mode: str, buffering: int = -1):
         """
-        Sauvegarde les événements dans le fichier de stockage.
+        Ouvre un fichier en écriture, en créant le dossier de stockage au besoin.
+        
+        Le dossier n'est créé qu'en cas d'échec de l'ouverture, ce qui évite
+        un appel système à chaque instanciation ou écriture.
+        
+        Args:
+            path: Le fichier à ouvrir
+            mode: Mode d'ouverture binaire ('a+b' ou 'wb')
+            buffering: Politique de tampon, comme pour open()
         """
-        with open(self.storage_path, 'w') as f:
-            json.dump([event.to_dict() for event in self._events], f, indent=2)
+        try:
+            return open(path, mode, buffering)
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            return open(path, mode, buffering)
+
+    def _append(self, *records: bytes) -> None:
+        """
+        Ajoute des enregistrements en fin de fichier de stockage.
+        
+        Le fichier est ouvert sans tampon : le lot, déjà assemblé, part en
+        un seul appel système write() en mode O_APPEND, qui place les lignes
+        d'un seul tenant en fin de fichier même si un autre processus y écrit.
+        
+        Si le fichier ne se termine pas par un saut de ligne (écriture
+        interrompue), un saut de ligne est écrit d'abord : le lot ne doit pas
+        prolonger la ligne tronquée, qui serait ignorée au chargement.
+        
+        Args:
+            records: Événements ou tombstones encodés en JSON
+        """
+        data = _join_lines(records)
+        # Les positions connues ne couvrent pas les lignes ajoutées
+        self._offsets = None
+        with self._open_for_write(self.storage_path, 'a+b', buffering=0) as f:
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    data = b'\n' + data
+            view = memoryview(data)
+            # Sans tampon, une écriture partielle est possible : on reprend la suite
+            while view:
+                view = view[f.write(view):]
+
+    def _compact(self) -> None:
+        """
+        Réécrit le fichier de stockage avec les seuls événements existants.
+        
+        L'écriture passe par un fichier temporaire remplacé atomiquement, pour
+        ne jamais laisser un fichier à moitié écrit.
+        """
+        events = self._event_list
+        assert events is not None, "les événements doivent être chargés avant la compaction"
+        tmp_path = self.storage_path.with_name(self.storage_path.name + '.tmp')
+        with self._open_for_write(tmp_path, 'wb') as f:
+            f.write(_join_lines([event.to_json() for event in events]))
+        os.replace(tmp_path, self.storage_path)
+        self._tombstones = 0
+        self._offsets = None
 
-    def add_event(self, event: Event) -> bool:
+    def add_event(self, event: Event, check_conflicts: bool = True) -> bool:
         """
         Ajoute un événement après vérification des conflits.
         
+        Sans vérification des conflits, et si les événements n'ont pas encore
+        été chargés, l'événement est simplement ajouté en fin de fichier sans
+        charger celui-ci : seul le premier événement enregistré est relu pour
+        vérifier le fuseau horaire, et l'unicité de l'ID n'est pas vérifiée.
+        
         Args:
             event: L'événement à ajouter
+            check_conflicts: Avertir si l'événement est en conflit
             
         Returns:
             bool: True si l'ajout est réussi
+            
+        Raises:
+            ValueError: Si un événement avec le même ID existe déjà
+            TypeError: Si l'événement est naïf et les événements enregistrés
+            avec fuseau horaire, ou l'inverse
         """
-        if self.has_conflict(event):
+        if not check_conflicts and self._event_list is None:
+            reference = self._stored_reference_time()
+            # Un ancien fichier a été chargé (et converti) pour être relu
+            if self._event_list is None:
+                _check_same_timezone(event.start_time, reference)
+                self._append(event.to_json())
+                return True
+        
+        self._ensure_loaded()
+        if event.id in self._by_id:
+            raise ValueError(f"Un événement avec l'ID {event.id} existe déjà")
+        
+        if check_conflicts:
+            if self.has_conflict(event):
+                warnings.warn(
+                    "Événement en conflit avec un événement existant. Ajout tout de même.",
+                    UserWarning
+                )
+        else:
+            _check_same_timezone(event.start_time, self._reference_time())
+        
+        self._insert(event)
+        self._append(event.to_json())
+        return True
+
+    def add_events(self, events: Iterable[Event], *, warn_mode: str = 'batch') -> int:
+        """
+        Ajoute un lot d'événements en une seule opération.
+        
+        Le lot est trié chronologiquement puis fusionné dans la liste triée.
+        Les conflits, avec les événements existants ou au sein du lot, sont
+        comptés et signalés par un unique avertissement, et le fichier de
+        stockage n'est écrit qu'une fois.
+        
+        Args:
+            events: Les événements à ajouter
+            warn_mode: 'batch' pour un avertissement récapitulatif, 'none'
+                pour seulement renvoyer le nombre de conflits
+            
+        Returns:
+            int: Nombre d'événements du lot en conflit avec un événement
+            existant ou un événement antérieur du lot
+            
+        Raises:
+            ValueError: Si un ID est déjà présent ou dupliqué dans le lot,
+            auquel cas aucun événement n'est ajouté, ou si warn_mode est inconnu
+        """
+        if warn_mode not in ('batch', 'none'):
+            raise ValueError(f"Mode d'avertissement inconnu : {warn_mode}")
+        batch = sorted(events, key=_chronological)
+        if not batch:
+            return 0
+        
+        self._ensure_loaded()
+        reference = self._reference_time() or batch[0].start_time
+        batch_ids = set()
+        for event in batch:
+            _check_same_timezone(event.start_time, reference)
+            if event.id in self._by_id or event.id in batch_ids:
+                raise ValueError(f"Un événement avec l'ID {event.id} existe déjà")
+            batch_ids.add(event.id)
+        
+        # Le lot étant trié par début, un événement chevauche un événement
+        # antérieur du lot si et seulement si l'une des fins précédentes le dépasse
+        conflicting = 0
+        batch_max_end = None
+        for event in batch:
+            if (batch_max_end is not None and batch_max_end > event._start_ts) or self.has_conflict(event):
+                conflicting += 1
+            if batch_max_end is None or event._end_ts > batch_max_end:
+                batch_max_end = event._end_ts
+        
+        if len(batch) < _BULK_REINDEX_SIZE:
+            for event in batch:
+                self._insert(event)
+        else:
+            self._events.extend(batch)
+            self._reindex()
+        self._append(*(event.to_json() for event in batch))
+        
+        if conflicting and warn_mode == 'batch':
             warnings.warn(
-                "Événement en conflit avec un événement existant. Ajout tout de même.",
+                f"{conflicting} événement(s) en conflit avec des événements existants. Ajout tout de même.",
                 UserWarning
             )
-        
-        self._events.append(event)
-        self._save_events()
-        return True
+        return conflicting
 
 
     def remove_event(self, event_id: str) -> bool:
@@ -75,19 +491,31 @@ class EventManager:
         Returns:
             bool: True si l'événement a été supprimé, False sinon
         """
-        initial_length = len(self._events)
-        self._events = [evt for evt in self._events if str(evt.id) != event_id]
+        self._ensure_loaded()
+        event = self._by_id.pop(event_id, None)
+        if event is None:
+            return False
+        
+        index = self._index_of(event)
+        del self._events[index]
+        del self._starts[index]
+        del self._ends[index]
+        self._max_ends = None
+        self._conflicts = None
         
-        if len(self._events) < initial_length:
-            self._save_events()
-            return True
-        return False
+        self._append(_json.dumps({'_tombstone': event_id}))
+        self._tombstones += 1
+        if self._tombstones > len(self._events) // 2:
+            self._compact()
+        return True
 
     def clear_events(self) -> None:
         """
         Supprime tous les événements et le fichier de stockage.
         """
-        self._events.clear()
+        self._event_list = []
+        self._reindex()
+        self._tombstones = 0
         if self.storage_path.exists():
             self.storage_path.unlink()
 
@@ -95,28 +523,42 @@ class EventManager:
         """
         Vérifie si un événement est en conflit avec les événements existants.
         
+        Seuls les événements qui commencent avant la fin de celui-ci peuvent le
+        chevaucher : une recherche dichotomique borne les candidats, et il y a
+        conflit si la plus tardive de leurs fins, lue dans la colonne des
+        maximums cumulés, dépasse son début. Complexité O(log n).
+        
+        Un événement entièrement avant le premier début ou après la dernière
+        fin est écarté en O(1), sans recherche : c'est le cas courant d'un
+        ajout à la suite du calendrier.
+        
         Args:
             event: L'événement à vérifier
             
         Returns:
             bool: True s'il y a un conflit, False sinon
         """
-        for existing_event in self._events:
-            if existing_event.overlaps(event):
-                return True
-        return False
+        _check_same_timezone(event.start_time, self._reference_time())
+        starts = self._starts
+        if not starts or event._end_ts <= starts[0]:
+            return False
+        max_ends = self._running_max_ends()
+        if event._start_ts >= max_ends[-1]:
+            return False
+        stop = bisect_left(starts, event._end_ts)
+        return max_ends[stop - 1] > event._start_ts
 
     def list_events(self) -> List[Event]:
         """
         Retourne la liste de tous les événements par ordre chronologique
         
+        Les événements sont maintenus triés à l'insertion, aucun tri n'est
+        donc nécessaire ici.
+        
         Returns:
             List[Event]: Liste des événements
         """
-        return sorted(
-            self._events,
-            key=lambda event: (event.start_time, event.end_time)
-        )
+        return list(self._events)
     
     def list_events_between(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> List[Event]:
         """
@@ -132,56 +574,156 @@ class EventManager:
         Returns:
             List[Event]: Liste des événements dans la période
         """
-        events = self.list_events()  # Déjà triés chronologiquement
+        # Les événements étant triés par début, ceux qui commencent au plus
+        # tard à end forment un préfixe, borné par dichotomie
+        for bound in (start, end):
+            if bound is not None:
+                _check_same_timezone(bound, self._reference_time())
         
-        if start:
-            events = [e for e in events if e.end_time >= start]
-        if end:
-            events = [e for e in events if e.start_time <= end]
-            
-        return events
+        stop = len(self._events) if end is None else bisect_right(self._starts, _to_timestamp(end))
+        if start is None:
+            return self._events[:stop]
+        
+        # Les événements dont toutes les fins précédentes sont avant start
+        # forment eux aussi un préfixe, écarté sans être parcouru
+        start_ts = _to_timestamp(start)
+        first = bisect_left(self._running_max_ends(), start_ts, 0, stop)
+        events, ends = self._events, self._ends
+        return [events[index] for index in range(first, stop) if ends[index] >= start_ts]
 
     def get_event_by_id(self, event_id: str) -> Optional[Event]:
         """
         Récupère un événement par son ID.
         
+        Si les événements n'ont pas encore été chargés, l'événement est relu
+        directement dans le fichier : la première recherche indexe la
+        position de chaque événement, sans construire ni trier les autres,
+        et les suivantes lisent une seule ligne.
+        
         Args:
             event_id: L'ID de l'événement recherché
             
         Returns:
             Optional[Event]: L'événement trouvé ou None
         """
-        return next((e for e in self._events if str(e.id) == event_id), None)    
+        if self._event_list is None:
+            return self._find_stored(event_id)
+        return self._by_id.get(event_id)
+
+    def _find_stored(self, event_id: str) -> Optional[Event]:
+        """
+        Cherche un événement dans le fichier de stockage sans le charger.
+        
+        Args:
+            event_id: L'ID de l'événement recherché
+            
+        Returns:
+            Optional[Event]: L'événement trouvé ou None
+        """
+        if self._offsets is None:
+            offsets = self._index_offsets()
+            if offsets is None:
+                # Ancien format : le chargement le convertit en JSON Lines
+                self._ensure_loaded()
+                return self._by_id.get(event_id)
+            self._offsets = offsets
+        
+        offset = self._offsets.get(event_id)
+        if offset is None:
+            return None
+        with open(self.storage_path, 'rb') as f:
+            f.seek(offset)
+            return Event.from_dict(_json.loads(f.readline()))
+
+    def _index_offsets(self) -> Optional[Dict[str, int]]:
+        """
+        Indexe la position de la ligne de chaque événement du fichier.
+        
+        Les lignes sont rejouées comme au chargement : la dernière ligne d'un
+        ID l'emporte, une tombstone retirant l'événement.
+        
+        Returns:
+            Optional[Dict[str, int]]: Les positions par ID, ou None si le
+            fichier est à l'ancien format tableau JSON
+        """
+        offsets: Dict[str, int] = {}
+        try:
+            f = open(self.storage_path, 'rb')
+        except FileNotFoundError:
+            return offsets
+        with f:
+            offset, first_line = _first_line(f)
+            if first_line.lstrip().startswith(b'['):
+                return None
+            for offset, record in _parse_records(chain((first_line,), f), offset):
+                if '_tombstone' in record:
+                    offsets.pop(record['_tombstone'], None)
+                elif record.get('id'):
+                    offsets[record['id']] = offset
+        return offsets
 
     def find_conflicts(self) -> Dict[str, List[Event]]:
         """
         Trouve tous les conflits temporels entre les événements gérés.
         
+        Les paires en conflit sont calculées sur les bornes entières des
+        événements par un noyau en O(n log n + k), vectorisé avec NumPy
+        lorsqu'il est installé (voir event_planner._kernels). Le résultat est
+        conservé jusqu'à la prochaine modification des événements.
+        
         Returns:
             Dictionnaire avec les IDs des événements comme clés et 
             la liste de leurs événements en conflit comme valeurs
         """
-        conflicts = {}
+        events = self._events
+        if self._conflicts is None:
+            self._conflicts = self._compute_conflicts(events)
+        # Copie, pour que le résultat conservé ne soit pas modifié par l'appelant
+        return {event_id: list(conflicting) for event_id, conflicting in self._conflicts.items()}
+
+    def _compute_conflicts(self, events: List[Event]) -> Dict[str, List[Event]]:
+        """
+        Calcule les conflits pour find_conflicts.
         
-        # Comparer chaque événement avec tous les autres
-        for i, event in enumerate(self._events):
-            # On ne compare qu'avec les événements suivants pour éviter les doublons
-            conflicting_events = [
-                other_event 
-                for other_event in self._events[i + 1:]
-                if event.overlaps(other_event)
-            ]
+        Args:
+            events: Les événements gérés, triés chronologiquement
             
-            if conflicting_events:
-                # Si l'événement a des conflits, on l'ajoute au dictionnaire
-                event_id = str(event.id)
-                conflicts[event_id] = conflicting_events
-                
-                # On ajoute aussi la relation inverse pour chaque conflit
-                for other_event in conflicting_events:
-                    other_id = str(other_event.id)
-                    if other_id not in conflicts:
-                        conflicts[other_id] = []
-                    conflicts[other_id].append(event)
-
-        return conflicts
\ No newline at end of file
+        Returns:
+            Dict[str, List[Event]]: Les événements en conflit, par ID
+        """
+        conflicts: Dict[str, List[Event]] = {}
+        firsts, seconds = conflict_pairs(self._starts, self._ends)
+        
+        # Chaque paire n'est rapportée qu'une fois, on enregistre la relation
+        # dans les deux sens
+        for first, second in zip(firsts, seconds):
+            event, other_event = events[first], events[second]
+            conflicts.setdefault(event.id, []).append(other_event)
+            conflicts.setdefault(other_event.id, []).append(event)
+
+        return conflicts
+
+    def intersect(self, other: 'EventManager') -> List[Tuple[Event, Event]]:
+        """
+        Trouve les conflits entre les événements de deux gestionnaires.
+        
+        Les deux listes étant triées par début, les paires sont énumérées
+        par recherche dichotomique sur les colonnes de bornes, sans comparer
+        chaque événement à tous ceux de l'autre calendrier.
+        
+        Args:
+            other: Le gestionnaire dont on compare les événements
+            
+        Returns:
+            List[Tuple[Event, Event]]: Les paires (événement de ce gestionnaire,
+            événement de other) qui se chevauchent, par ordre chronologique
+            
+        Raises:
+            TypeError: Si l'un des calendriers a des dates naïves et l'autre
+            des dates avec fuseau
+        """
+        events, other_events = self._events, other._events
+        if other_events:
+            _check_same_timezone(other_events[0].start_time, self._reference_time())
+        pairs = sorted(zip(*cross_pairs(self._starts, self._ends, other._starts, other._ends)))
+        return [(events[index], other_events[other_index]) for index, other_index in pairs]
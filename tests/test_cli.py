@@ -18,7 +18,7 @@ class TestCLI:
         self.test_home = tmp_path / "test_home"
         self.test_home.mkdir()
         # Configure le chemin de stockage des tests
-        self.storage_path = self.test_home / '.event_planner' / 'events.json'
+        self.storage_path = self.test_home / '.event_planner' / 'events.jsonl'
         # Crée le runner Click pour les tests
         self.runner = CliRunner()
         
@@ -52,7 +52,7 @@ class TestCLI:
         
         # Vérifie que l'événement a été sauvegardé
         with open(self.storage_path) as f:
-            data = json.load(f)
+            data = [json.loads(line) for line in f]
         assert len(data) == 1
         assert data[0]['name'] == 'Test Event'
         assert data[0]['description'] == 'Test Description'
@@ -153,4 +153,69 @@ class TestCLI:
             '-e', '2024-12-01 11:00'
         ])
 
-        assert "Erreur" in result.output
\ No newline at end of file
+        assert "Erreur" in result.output
+
+    def test_list_between(self):
+        """Teste le filtrage de la liste par période"""
+        self.runner.invoke(cli, ['add', '-n', 'Matin', '-s', '2024-12-01 09:00', '-e', '2024-12-01 10:00'])
+        self.runner.invoke(cli, ['add', '-n', 'Soir', '-s', '2024-12-01 18:00', '-e', '2024-12-01 19:00'])
+        
+        result = self.runner.invoke(cli, ['list', '-s', '2024-12-01 12:00'])
+        assert result.exit_code == 0
+        assert "depuis le 2024-12-01 12:00" in result.output
+        assert "Soir" in result.output
+        assert "Matin" not in result.output
+        
+        result = self.runner.invoke(cli, ['list', '-e', 'pas-une-date'])
+        assert result.exit_code != 0
+        assert "date invalide" in result.output
+
+    def test_add_no_conflict_check(self):
+        """Teste l'ajout sans vérification des conflits"""
+        args = ['add', '-n', 'Event', '-s', '2024-12-01 10:00', '-e', '2024-12-01 11:00']
+        self.runner.invoke(cli, args)
+        result = self.runner.invoke(cli, args + ['--no-conflict-check'])
+        
+        assert result.exit_code == 0
+        assert "ajouté avec succès" in result.output
+        result = self.runner.invoke(cli, ['list', '--conflicts'])
+        assert "Conflits détectés" in result.output
+
+    def test_list_conflicts_between(self):
+        """Teste le filtrage des conflits par période"""
+        for name, start, end in [
+            ('Event A', '2024-12-01 10:00', '2024-12-01 11:30'),
+            ('Event B', '2024-12-01 11:00', '2024-12-01 12:00'),
+            ('Event C', '2024-12-02 10:00', '2024-12-02 11:30'),
+            ('Event D', '2024-12-02 11:00', '2024-12-02 12:00'),
+        ]:
+            self.runner.invoke(cli, ['add', '-n', name, '-s', start, '-e', end])
+        
+        result = self.runner.invoke(cli, ['list', '--conflicts', '-s', '2024-12-02 00:00'])
+        assert result.exit_code == 0
+        assert "Event C" in result.output
+        assert "Event D" in result.output
+        assert "Event A" not in result.output
+        
+        result = self.runner.invoke(cli, ['list', '--conflicts', '-s', '2024-12-03 00:00'])
+        assert "Aucun conflit trouvé dans la période spécifiée" in result.output
+
+    def test_list_timezone_mismatch(self):
+        """Teste le rejet d'une date avec fuseau face à des événements naïfs"""
+        self.runner.invoke(cli, ['add', '-n', 'Matin', '-s', '2024-12-01 09:00', '-e', '2024-12-01 10:00'])
+        
+        for args in (['list'], ['list', '--conflicts']):
+            result = self.runner.invoke(cli, args + ['-s', '2024-12-01T09:00+02:00'])
+            assert result.exit_code == 2
+            assert not isinstance(result.exception, TypeError)
+            assert "fuseau horaire" in result.output
+
+    def test_list_load_error_not_reported_as_bad_dates(self):
+        """Teste qu'une erreur de chargement n'est pas présentée comme une erreur de --start/--end"""
+        self.storage_path.parent.mkdir()
+        self.storage_path.write_text(json.dumps({"id": "1", "name": "Cassé", "start_time": None, "end_time": None}))
+        
+        for args in (['list'], ['list', '-s', '2024-12-01 09:00']):
+            result = self.runner.invoke(cli, args)
+            assert isinstance(result.exception, TypeError)
+            assert "fuseau horaire" not in result.output
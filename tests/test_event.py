@@ -1,5 +1,6 @@
 import pytest
-from datetime import datetime, timedelta
+import json
+from datetime import datetime, timedelta, timezone
 from uuid import UUID
 from event_planner.event import Event
 
@@ -13,7 +14,8 @@ class TestEvent:
         assert event.name == "Réunion"
         assert event.start_time == start
         assert event.end_time == end
-        assert isinstance(event.id, UUID)
+        assert isinstance(event.id, str)
+        assert UUID(event.id)
 
     def test_invalid_dates(self):
         """Test qu'une exception est levée si end_time < start_time"""
@@ -71,6 +73,21 @@ class TestEvent:
         assert event_dict["start_time"] == start.isoformat()
         assert event_dict["end_time"] == end.isoformat()
         assert UUID(event_dict["id"])
+        # L'ID est conservé sous forme de texte, sans conversion à chaque appel
+        assert event_dict["id"] is event.id
+        assert event.to_dict()["start_time"] is event_dict["start_time"]
+
+    def test_to_json(self):
+        """Test que la sérialisation JSON correspond à to_dict"""
+        paris = timezone(timedelta(hours=1))
+        odd_offset = timezone(timedelta(hours=5, minutes=30, seconds=15))
+        for start, end in [
+            (datetime(2024, 1, 1, 10, 0), datetime(2024, 1, 1, 11, 0, 0, 500)),
+            (datetime(2024, 1, 1, 10, 0, tzinfo=paris), datetime(2024, 1, 1, 11, 0, tzinfo=paris)),
+            (datetime(2024, 1, 1, 10, 0, tzinfo=odd_offset), datetime(2024, 1, 1, 11, 0, tzinfo=odd_offset)),
+        ]:
+            event = Event("Réunion", start, end, description="Salle é")
+            assert json.loads(event.to_json()) == event.to_dict()
 
     def test_from_dict(self):
         """Test la désérialisation depuis un dictionnaire"""
@@ -86,6 +103,7 @@ class TestEvent:
         assert event.start_time == datetime(2024, 1, 1, 10, 0)
         assert event.end_time == datetime(2024, 1, 1, 11, 0)
         assert str(event.id) == "123e4567-e89b-12d3-a456-426614174000"
+        assert event.uuid == UUID("123e4567-e89b-12d3-a456-426614174000")
         
     def test_duration(self):
         """Test la propriété durée d'un Event"""
@@ -94,6 +112,25 @@ class TestEvent:
         event = Event("Réunion", start, end)
         
         assert event.duration == timedelta(hours=1)
+        assert event.duration is event.duration
+        
+    def test_reassign_dates(self):
+        """Test que les valeurs dérivées suivent la modification des dates"""
+        event = Event("Réunion", datetime(2024, 1, 1, 10, 0), datetime(2024, 1, 1, 11, 0))
+        later = Event("Déjeuner", datetime(2024, 1, 1, 12, 0), datetime(2024, 1, 1, 13, 0))
+        assert event.duration == timedelta(hours=1)
+        assert not event.overlaps(later)
+        event.to_dict()
+        
+        event.end_time = datetime(2024, 1, 1, 12, 30)
+        assert event.overlaps(later)
+        assert event.duration == timedelta(hours=2, minutes=30)
+        assert event.to_dict()["end_time"] == event.end_time.isoformat()
+        
+        event.start_time = datetime(2024, 1, 1, 12, 0)
+        assert event.duration == timedelta(minutes=30)
+        assert event.to_dict()["start_time"] == "2024-01-01T12:00:00"
+        assert json.loads(event.to_json()) == event.to_dict()
         
     def test_overlap_same_event(self):
         """Test si la bonne exception est levée lorsque l'on cherche un overlap d'un event sur lui même"""
@@ -102,4 +139,83 @@ class TestEvent:
         event = Event("Réunion", start, end)
         
         with pytest.raises(ValueError):
-            event.overlaps(event)
\ No newline at end of file
+            event.overlaps(event)
+        
+        # Une copie portant le même ID est aussi considérée comme le même événement
+        with pytest.raises(ValueError):
+            event.overlaps(Event.from_dict(event.to_dict()))
+            
+    def test_overlaps_encompassing_and_adjacent(self):
+        """Test le chevauchement d'un événement englobant et l'absence de conflit entre événements adjacents"""
+        outer = Event("Outer", datetime(2024, 1, 1, 9, 0), datetime(2024, 1, 1, 17, 0))
+        inner = Event("Inner", datetime(2024, 1, 1, 10, 0), datetime(2024, 1, 1, 11, 0))
+        after = Event("After", datetime(2024, 1, 1, 17, 0), datetime(2024, 1, 1, 18, 0))
+        
+        assert outer.overlaps(inner)
+        assert inner.overlaps(outer)
+        assert not outer.overlaps(after)
+        assert not after.overlaps(outer)
+
+    def test_slots(self):
+        """Test que l'événement n'a pas de __dict__ par instance"""
+        event = Event("Réunion", datetime(2024, 1, 1, 10, 0), datetime(2024, 1, 1, 11, 0))
+        
+        assert not hasattr(event, "__dict__")
+        with pytest.raises(AttributeError):
+            event.location = "Salle 1"
+
+    def test_from_dict_list(self):
+        """Test la désérialisation d'un lot de dictionnaires"""
+        events = [
+            Event("Réunion", datetime(2024, 1, 1, 10, 0), datetime(2024, 1, 1, 11, 0), description="Salle 1"),
+            Event("Déjeuner", datetime(2024, 1, 1, 12, 0), datetime(2024, 1, 1, 13, 0))
+        ]
+        
+        loaded = Event.from_dict_list(event.to_dict() for event in events)
+        assert loaded == events
+        assert loaded[0].overlaps(events[1]) is False
+        assert loaded[1].duration == timedelta(hours=1)
+
+    def test_from_dict_list_invalid_dates(self):
+        """Test que le chargement en lot rejette les dates inversées, comme from_dict"""
+        data = Event("Réunion", datetime(2024, 1, 1, 10, 0), datetime(2024, 1, 1, 11, 0)).to_dict()
+        data["start_time"], data["end_time"] = data["end_time"], data["start_time"]
+        
+        with pytest.raises(ValueError):
+            Event.from_dict(data)
+        with pytest.raises(ValueError):
+            Event.from_dict_list([data])
+        
+        data["end_time"] = data["start_time"]
+        with pytest.raises(ValueError):
+            Event.from_dict_list([data])
+
+    def test_from_dict_list_mixed_timezones(self):
+        """Test que le chargement en lot rejette un événement mi-naïf mi-avec fuseau, comme from_dict"""
+        data = Event("Réunion", datetime(2024, 1, 1, 10, 0), datetime(2024, 1, 1, 11, 0)).to_dict()
+        data["end_time"] += "+00:00"
+        
+        with pytest.raises(TypeError):
+            Event.from_dict(data)
+        with pytest.raises(TypeError):
+            Event.from_dict_list([data])
+
+    def test_from_dict_list_shares_names(self):
+        """Test que les noms identiques relus partagent la même chaîne"""
+        start = datetime(2024, 1, 1, 10, 0)
+        datas = [
+            Event("Réunion hebdo", start + timedelta(days=day), start + timedelta(days=day, hours=1)).to_dict()
+            for day in range(2)
+        ]
+        datas[1]["name"] = "".join(datas[1]["name"])
+        assert datas[0]["name"] is not datas[1]["name"]
+        
+        first, second = Event.from_dict_list(datas)
+        assert first.name is second.name
+
+    def test_from_dict_list_null_name(self):
+        """Test qu'un nom null est relu tel quel, comme par from_dict"""
+        data = Event("Réunion", datetime(2024, 1, 1, 10, 0), datetime(2024, 1, 1, 11, 0)).to_dict()
+        data["name"] = None
+        
+        assert Event.from_dict_list([data])[0] == Event.from_dict(data)
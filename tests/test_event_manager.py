@@ -1,9 +1,13 @@
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+import json
+import random
+import warnings
 import tempfile
 from pathlib import Path
 from event_planner.event_manager import EventManager
 from event_planner.event import Event
+from event_planner import _json
 
 class TestEventManager:
     @pytest.fixture
@@ -103,4 +107,326 @@ class TestEventManager:
         event_id = str(event.id)
         manager.add_event(event)
         
-        assert str(manager.get_event_by_id(event_id).id) == event_id
\ No newline at end of file
+        assert str(manager.get_event_by_id(event_id).id) == event_id
+        
+    def test_find_conflicts_relations(self, manager):
+        """Test que les conflits sont symétriques et ignorent les événements adjacents"""
+        long_event = Event("Long", datetime(2024, 1, 1, 9, 0), datetime(2024, 1, 1, 18, 0))
+        inner = Event("Inner", datetime(2024, 1, 1, 10, 0), datetime(2024, 1, 1, 11, 0))
+        adjacent = Event("Adjacent", datetime(2024, 1, 1, 18, 0), datetime(2024, 1, 1, 19, 0))
+        
+        with pytest.warns(UserWarning):
+            for event in (long_event, inner, adjacent):
+                manager.add_event(event)
+        
+        conflicts = manager.find_conflicts()
+        assert set(conflicts) == {str(long_event.id), str(inner.id)}
+        assert conflicts[str(long_event.id)] == [inner]
+        assert conflicts[str(inner.id)] == [long_event]
+        
+    def test_find_conflicts_cached(self, manager, sample_events):
+        """Test que le résultat conservé suit les modifications"""
+        manager.add_event(sample_events[0])
+        assert manager.find_conflicts() == {}
+        
+        with pytest.warns(UserWarning):
+            manager.add_event(sample_events[2])
+        conflicts = manager.find_conflicts()
+        assert set(conflicts) == {sample_events[0].id, sample_events[2].id}
+        
+        conflicts[sample_events[0].id].clear()
+        assert manager.find_conflicts()[sample_events[0].id] == [sample_events[2]]
+        
+        manager.remove_event(sample_events[2].id)
+        assert manager.find_conflicts() == {}
+        
+    def test_has_conflict(self, manager):
+        """Test la détection de conflit avec un long événement antérieur et un événement adjacent"""
+        manager.add_event(Event("Long", datetime(2024, 1, 1, 8, 0), datetime(2024, 1, 1, 18, 0)))
+        manager.add_event(Event("Soir", datetime(2024, 1, 1, 18, 0), datetime(2024, 1, 1, 20, 0)))
+        
+        assert manager.has_conflict(Event("Midi", datetime(2024, 1, 1, 12, 0), datetime(2024, 1, 1, 13, 0)))
+        assert not manager.has_conflict(Event("Nuit", datetime(2024, 1, 1, 20, 0), datetime(2024, 1, 1, 22, 0)))
+        assert not manager.has_conflict(Event("Aube", datetime(2024, 1, 1, 6, 0), datetime(2024, 1, 1, 8, 0)))
+
+    def test_has_conflict_after_updates(self, manager):
+        """Test que la détection reste exacte au fil des ajouts et suppressions"""
+        day = datetime(2024, 1, 1)
+        hours = [(9, 17), (10, 11), (12, 13), (14, 15), (18, 19)]
+        events = [
+            Event(f"Event {start}", day + timedelta(hours=start), day + timedelta(hours=end))
+            for start, end in hours
+        ]
+        with pytest.warns(UserWarning):
+            for event in events:
+                manager.add_event(event)
+
+        probe = Event("Probe", day + timedelta(hours=15, minutes=30), day + timedelta(hours=16))
+        assert manager.has_conflict(probe)
+        manager.remove_event(events[0].id)
+        assert not manager.has_conflict(probe)
+        assert manager.list_events_between(probe.start_time, probe.end_time) == []
+        manager.add_event(Event("Tard", day + timedelta(hours=15), day + timedelta(hours=16)))
+        assert manager.has_conflict(probe)
+
+    def test_list_events_same_start(self, manager):
+        """Test que les événements commençant en même temps sont triés par fin"""
+        start = datetime(2024, 1, 1, 10, 0)
+        long_event = Event("Long", start, datetime(2024, 1, 1, 12, 0))
+        short_event = Event("Short", start, datetime(2024, 1, 1, 11, 0))
+        
+        manager.add_event(long_event)
+        with pytest.warns(UserWarning):
+            manager.add_event(short_event)
+        
+        assert manager.list_events() == [short_event, long_event]
+        
+    def test_storage_tombstones(self, manager, sample_events, temp_storage):
+        """Test que les suppressions sont persistées puis compactées"""
+        with pytest.warns(UserWarning):
+            for event in sample_events:
+                manager.add_event(event)
+        manager.remove_event(str(sample_events[0].id))
+        
+        # Une tombstone pour deux événements restants : pas encore de compaction
+        assert len(temp_storage.read_text().splitlines()) == 4
+        assert [e.name for e in EventManager(temp_storage).list_events()] == ["Event 3", "Event 2"]
+        
+        manager.remove_event(str(sample_events[1].id))
+        assert len(temp_storage.read_text().splitlines()) == 1
+        
+    def test_storage_legacy_format(self, sample_events, temp_storage):
+        """Test le chargement et la conversion d'un fichier au format tableau JSON"""
+        temp_storage.write_text(json.dumps([event.to_dict() for event in sample_events[:2]]))
+        
+        manager = EventManager(temp_storage)
+        assert [e.name for e in manager.list_events()] == ["Event 1", "Event 2"]
+        assert len(temp_storage.read_text().splitlines()) == 2
+        
+    def test_storage_legacy_format_damaged(self, sample_events, tmp_path):
+        """Test qu'un ancien fichier illisible est mis de côté sans perdre les ajouts suivants"""
+        storage = tmp_path / "events.json"
+        content = json.dumps([event.to_dict() for event in sample_events[:2]])[:-10]
+        storage.write_text(content)
+        
+        manager = EventManager(storage)
+        with pytest.warns(UserWarning, match="illisible"):
+            assert manager.list_events() == []
+        manager.add_event(sample_events[2])
+        
+        assert (tmp_path / "events.json.corrupt").read_text() == content
+        assert [e.name for e in EventManager(storage).list_events()] == ["Event 3"]
+        
+    def test_storage_damaged_lines(self, sample_events, temp_storage):
+        """Test que les lignes vides, tronquées ou qui ne sont pas des objets sont ignorées"""
+        lines = [json.dumps(event.to_dict()) for event in sample_events[:2]]
+        temp_storage.write_text("\n" + "\n".join(lines + ["[]", "1", '"texte"']) + "\n" + lines[0][:20])
+        
+        manager = EventManager(temp_storage)
+        assert [e.name for e in manager.list_events()] == ["Event 1", "Event 2"]
+        
+    def test_append_after_truncated_line(self, sample_events, temp_storage):
+        """Test qu'un ajout après une ligne tronquée commence une nouvelle ligne"""
+        line = json.dumps(sample_events[0].to_dict())
+        temp_storage.write_text(line + "\n" + line[:20])
+        
+        EventManager(temp_storage).add_event(sample_events[1], check_conflicts=False)
+        
+        manager = EventManager(temp_storage)
+        assert [e.name for e in manager.list_events()] == ["Event 1", "Event 2"]
+        
+    def test_truncated_multibyte_character_stdlib(self, sample_events, temp_storage, monkeypatch):
+        """Test qu'une ligne coupée dans un caractère UTF-8 est ignorée sans orjson"""
+        monkeypatch.setattr(_json, 'loads', _json._stdlib_loads)
+        sample_events[0].name = "Réunion"
+        line = sample_events[0].to_json()
+        temp_storage.write_bytes(line + b"\n" + line[:line.index(b"\xc3") + 1])
+        
+        EventManager(temp_storage).add_event(sample_events[1], check_conflicts=False)
+        
+        manager = EventManager(temp_storage)
+        assert [e.name for e in manager.list_events()] == ["Réunion", "Event 2"]
+        
+    def test_add_duplicate_id(self, manager, sample_events):
+        """Test qu'un événement ne peut pas être ajouté deux fois"""
+        manager.add_event(sample_events[0])
+        
+        with pytest.raises(ValueError):
+            manager.add_event(sample_events[0])
+        assert len(manager.list_events()) == 1
+        
+    def test_add_events(self, manager, sample_events, temp_storage):
+        """Test l'ajout en lot, avec un unique avertissement pour les conflits"""
+        manager.add_event(sample_events[0])  # 10:00-11:00
+        
+        with pytest.warns(UserWarning, match="2 événement"):
+            conflicting = manager.add_events(sample_events[1:])  # 11:00-12:00 et 10:30-11:30
+        
+        assert conflicting == 2
+        assert [e.name for e in manager.list_events()] == ["Event 1", "Event 3", "Event 2"]
+        assert len(EventManager(temp_storage).list_events()) == 3
+        
+        with pytest.raises(ValueError):
+            manager.add_events(sample_events[:1])
+        
+    def test_add_events_empty(self, tmp_path):
+        """Test qu'un lot vide n'écrit rien"""
+        storage = tmp_path / "events.jsonl"
+        assert EventManager(storage).add_events([]) == 0
+        assert not storage.exists()
+        
+    def test_add_events_warn_mode(self, manager, sample_events):
+        """Test l'ajout en lot sans avertissement"""
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert manager.add_events(sample_events, warn_mode='none') == 2
+        
+        with pytest.raises(ValueError):
+            manager.add_events([], warn_mode='each')
+        assert len(manager.list_events()) == 3
+        
+    def test_add_events_large_batch(self, manager):
+        """Test l'ajout d'un lot assez grand pour être fusionné en une passe"""
+        events = [
+            Event(f"Event {hour}", datetime(2024, 1, 1) + timedelta(hours=hour),
+                  datetime(2024, 1, 1) + timedelta(hours=hour + 1))
+            for hour in range(100)
+        ]
+        manager.add_event(events[50])
+        
+        assert manager.add_events(reversed(events[:50] + events[51:])) == 0
+        assert manager.list_events() == events
+        assert manager.get_event_by_id(events[0].id) is events[0]
+        
+    def test_list_events_order_maintained(self, manager):
+        """Test que l'ordre chronologique est maintenu au fil des ajouts et suppressions"""
+        rng = random.Random(7)
+        day = datetime(2024, 1, 1)
+        events = [
+            Event(f"Event {index}", day + timedelta(minutes=start), day + timedelta(minutes=start + rng.randrange(1, 90)))
+            for index, start in enumerate(rng.randrange(0, 600) for _ in range(80))
+        ]
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            for event in events[:40]:
+                manager.add_event(event)
+            for event in events[:40:3]:
+                manager.remove_event(event.id)
+            manager.add_events(events[40:])
+        
+        expected = sorted(
+            (event for index, event in enumerate(events) if index >= 40 or index % 3),
+            key=lambda event: (event.start_time, event.end_time)
+        )
+        assert [e.start_time for e in manager.list_events()] == [e.start_time for e in expected]
+        assert [e.end_time for e in manager.list_events()] == [e.end_time for e in expected]
+        
+    def test_list_events_between(self, manager, sample_events):
+        """Test le filtrage par période, bornes incluses"""
+        with pytest.warns(UserWarning):
+            manager.add_events(sample_events)  # 10:00-11:00, 11:00-12:00, 10:30-11:30
+        
+        def names(start=None, end=None):
+            return [e.name for e in manager.list_events_between(start, end)]
+        
+        assert names() == ["Event 1", "Event 3", "Event 2"]
+        assert names(end=datetime(2024, 1, 1, 10, 30)) == ["Event 1", "Event 3"]
+        assert names(start=datetime(2024, 1, 1, 11, 30)) == ["Event 3", "Event 2"]
+        assert names(datetime(2024, 1, 1, 11, 15), datetime(2024, 1, 1, 11, 20)) == ["Event 3", "Event 2"]
+        
+    def test_mixed_timezones(self, manager, sample_events):
+        """Test qu'on ne peut pas mélanger dates naïves et dates avec fuseau"""
+        manager.add_event(sample_events[0])
+        aware = Event("UTC", datetime(2024, 1, 2, 10, 0, tzinfo=timezone.utc),
+                      datetime(2024, 1, 2, 11, 0, tzinfo=timezone.utc))
+        
+        with pytest.raises(TypeError):
+            manager.add_event(aware)
+        with pytest.raises(TypeError):
+            manager.add_events([aware])
+        with pytest.raises(TypeError):
+            manager.list_events_between(start=aware.start_time)
+        assert len(manager.list_events()) == 1
+        
+    def test_mixed_timezones_without_conflict_check(self, manager, sample_events, temp_storage):
+        """Test que le fuseau horaire est vérifié même sans vérification des conflits"""
+        manager.add_event(sample_events[0])
+        aware = Event("UTC", datetime(2024, 1, 2, 10, 0, tzinfo=timezone.utc),
+                      datetime(2024, 1, 2, 11, 0, tzinfo=timezone.utc))
+        
+        with pytest.raises(TypeError):
+            manager.add_event(aware, check_conflicts=False)
+        
+        unloaded = EventManager(temp_storage)
+        with pytest.raises(TypeError):
+            unloaded.add_event(aware, check_conflicts=False)
+        assert unloaded._event_list is None
+        unloaded.add_event(sample_events[1], check_conflicts=False)
+        
+        assert len(temp_storage.read_text().splitlines()) == 2
+        assert len(EventManager(temp_storage).list_events()) == 2
+        
+    def test_lazy_loading(self, manager, sample_events, temp_storage):
+        """Test que le stockage n'est lu qu'au premier besoin"""
+        manager.add_event(sample_events[0])
+        
+        new_manager = EventManager(temp_storage)
+        new_manager.add_event(sample_events[2], check_conflicts=False)
+        assert new_manager._event_list is None
+        
+        assert [e.name for e in new_manager.list_events()] == ["Event 1", "Event 3"]
+        
+    def test_get_event_by_id_unloaded(self, manager, sample_events, temp_storage):
+        """Test la recherche par ID dans le fichier, sans chargement complet"""
+        with pytest.warns(UserWarning):
+            for event in sample_events:
+                manager.add_event(event)
+        manager.remove_event(str(sample_events[1].id))
+        assert b"_tombstone" in temp_storage.read_bytes()
+        
+        new_manager = EventManager(temp_storage)
+        assert new_manager.get_event_by_id(str(sample_events[0].id)) == sample_events[0]
+        assert new_manager.get_event_by_id(str(sample_events[1].id)) is None
+        assert new_manager.get_event_by_id("nonexistent-id") is None
+        assert new_manager._event_list is None
+        assert set(new_manager._offsets) == {sample_events[0].id, sample_events[2].id}
+        
+        # Un ajout sans chargement est visible des recherches suivantes
+        late = Event("Late", datetime(2024, 1, 2, 10, 0), datetime(2024, 1, 2, 11, 0))
+        new_manager.add_event(late, check_conflicts=False)
+        assert new_manager.get_event_by_id(late.id) == late
+        assert new_manager.get_event_by_id(str(sample_events[2].id)) == sample_events[2]
+        assert new_manager._event_list is None
+        
+    def test_intersect(self, manager, tmp_path):
+        """Test les conflits entre deux calendriers"""
+        day = datetime(2024, 1, 1)
+        mine = [Event(f"Mine {h}", day + timedelta(hours=h), day + timedelta(hours=h + 2)) for h in (8, 9, 14)]
+        theirs = [Event(f"Theirs {h}", day + timedelta(hours=h), day + timedelta(hours=h + 1)) for h in (9, 10, 16)]
+        other = EventManager(tmp_path / "other.jsonl")
+        with pytest.warns(UserWarning):
+            manager.add_events(mine)
+        other.add_events(theirs)
+        
+        assert manager.intersect(other) == [
+            (mine[0], theirs[0]),
+            (mine[1], theirs[0]),
+            (mine[1], theirs[1]),
+        ]
+        assert other.intersect(manager) == [
+            (theirs[0], mine[0]),
+            (theirs[0], mine[1]),
+            (theirs[1], mine[1]),
+        ]
+        assert manager.intersect(EventManager(tmp_path / "empty.jsonl")) == []
+        
+    def test_storage_directory_created_on_write(self, sample_events, tmp_path):
+        """Test que le dossier de stockage n'est créé qu'à la première écriture"""
+        storage = tmp_path / "missing" / "events.jsonl"
+        manager = EventManager(storage)
+        
+        assert manager.list_events() == []
+        assert not storage.parent.exists()
+        
+        manager.add_event(sample_events[0])
+        assert storage.exists()
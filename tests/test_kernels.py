@@ -0,0 +1,84 @@
+import pytest
+import random
+from itertools import accumulate
+from event_planner import _kernels
+
+def brute_force_pairs(starts, ends):
+    """Paires en conflit calculées par comparaison exhaustive"""
+    return {
+        (i, j)
+        for i in range(len(starts))
+        for j in range(i + 1, len(starts))
+        if starts[i] < ends[j] and starts[j] < ends[i]
+    }
+
+def normalize(pairs):
+    """Ramène les paires à un ensemble de couples ordonnés"""
+    firsts, seconds = pairs
+    return {(min(i, j), max(i, j)) for i, j in zip(firsts, seconds)}
+
+class TestKernels:
+    @pytest.fixture
+    def intervals(self):
+        """Fixture qui génère des intervalles aléatoires triés par début, avec bornes partagées"""
+        rng = random.Random(42)
+        starts = sorted(rng.randrange(0, 500) for _ in range(300))
+        ends = [start + rng.randrange(1, 40) for start in starts]
+        return starts, ends
+
+    def test_python_sweep(self, intervals):
+        """Test que le balayage pur Python trouve exactement les conflits"""
+        starts, ends = intervals
+        pairs = normalize(_kernels._conflict_pairs_python(starts, ends))
+        assert pairs == brute_force_pairs(starts, ends)
+
+    def test_adjacent_intervals(self):
+        """Test que deux intervalles qui se touchent ne sont pas en conflit"""
+        assert normalize(_kernels.conflict_pairs([0, 10], [10, 20])) == set()
+        assert normalize(_kernels.conflict_pairs([0, 5], [10, 20])) == {(0, 1)}
+
+    def test_numpy_matches_python(self, intervals):
+        """Test que la version NumPy donne les mêmes paires que le balayage"""
+        pytest.importorskip("numpy")
+        starts, ends = intervals
+        pairs = normalize(_kernels._conflict_pairs_numpy(starts, ends))
+        assert pairs == brute_force_pairs(starts, ends)
+
+    def test_numba_matches_python(self, intervals):
+        """Test que le noyau Numba énumère les mêmes paires que NumPy"""
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("numba")
+        sorted_starts, sorted_ends = (np.asarray(bounds, dtype=np.int64) for bounds in intervals)
+        
+        numba_pairs = _kernels._numba_kernel()(sorted_starts, sorted_ends)
+        numpy_pairs = _kernels._expand_sorted_pairs(sorted_starts, sorted_ends)
+        assert normalize(numba_pairs) == normalize(numpy_pairs)
+
+    def test_cross_pairs(self, intervals):
+        """Test les conflits entre deux ensembles, bornes partagées comprises"""
+        starts, ends = intervals
+        a_starts, a_ends, b_starts, b_ends = starts[::2], ends[::2], starts[1::2], ends[1::2]
+        expected = {
+            (i, j)
+            for i in range(len(a_starts))
+            for j in range(len(b_starts))
+            if a_starts[i] < b_ends[j] and b_starts[j] < a_ends[i]
+        }
+        firsts, seconds = _kernels.cross_pairs(a_starts, a_ends, b_starts, b_ends)
+        assert len(firsts) == len(expected)
+        assert set(zip(firsts, seconds)) == expected
+
+    def test_running_max(self, intervals):
+        """Test le maximum cumulé des fins"""
+        _, ends = intervals
+        expected = [max(ends[:index + 1]) for index in range(len(ends))]
+        assert list(_kernels.running_max(ends)) == expected
+        assert list(_kernels.running_max([])) == []
+
+    def test_running_max_numpy(self, intervals):
+        """Test que le maximum cumulé vectorisé donne le même résultat"""
+        pytest.importorskip("numpy")
+        from array import array
+        _, ends = intervals
+        assert len(ends) >= _kernels.NUMPY_MIN_SIZE
+        assert _kernels.running_max(array('q', ends)) == array('q', accumulate(ends, max))